@@ -1,12 +1,13 @@
 """The Watchman integration."""
 
+from copy import deepcopy
 from datetime import timedelta
 from dataclasses import dataclass
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.event import async_track_point_in_utc_time
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STARTED,
@@ -62,6 +63,30 @@ from .const import (
 )
 
 
+# service calls which trigger configuration parsing
+_RELOAD_SERVICES = frozenset(
+    {SERVICE_RELOAD_CORE_CONFIG, SERVICE_RELOAD, SERVICE_RELOAD_ALL}
+)
+# states which make a state change of parsed entity worth a refresh
+_MONITORED_STATES = frozenset(MONITORED_STATES)
+
+
+def _state_or_missing(state) -> str:
+    """Return missing state if entity not found."""
+    return "missing" if state is None else state.state
+
+
+@callback
+def _reload_service_filter(event_data) -> bool:
+    """Filter out service calls which do not reload HA configuration."""
+    # service name is checked first as it rejects almost all calls, while
+    # domains like script or input_boolean are called often
+    return (
+        event_data.get("service") in _RELOAD_SERVICES
+        and event_data.get("domain") in TRACKED_EVENT_DOMAINS
+    )
+
+
 type WMConfigEntry = ConfigEntry[WMData]
 
 
@@ -80,7 +105,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: WMConfigEntry):
         f"::async_setup_entry:: Integration setup in progress. Home assistant path: {hass.config.path("")}"
     )
 
-    coordinator = WatchmanCoordinator(hass, _LOGGER, name=config_entry.title)
+    coordinator = WatchmanCoordinator(
+        hass, _LOGGER, name=config_entry.title, config_entry=config_entry
+    )
     # parsing shouldn't occur if HA is not running yet
     config_entry.runtime_data = WMData(
         coordinator, force_parsing=False, parse_reason=None
@@ -144,7 +171,12 @@ async def add_event_handlers(hass: HomeAssistant):
         """Schedule delayed refresh of the sensors state."""
         now = dt_util.utcnow()
         next_interval = now + timedelta(seconds=delay)
-        async_track_point_in_utc_time(hass, async_delayed_refresh_states, next_interval)
+        # cancel pending refresh if integration is unloaded before it fires
+        hass.data[DOMAIN].setdefault(HASS_DATA_CANCEL_HANDLERS, []).append(
+            async_track_point_in_utc_time(
+                hass, async_delayed_refresh_states, next_interval
+            )
+        )
 
     async def async_delayed_refresh_states(timedate):  # pylint: disable=unused-argument
         """Refresh sensors state."""
@@ -155,78 +187,109 @@ async def add_event_handlers(hass: HomeAssistant):
         await entry.runtime_data.coordinator.async_refresh()
 
     async def async_on_home_assistant_started(event):  # pylint: disable=unused-argument
+        # listener is removed by HA once fired, it mustn't be cancelled on unload
+        hdlr.remove(cancel_on_started)
         startup_delay = get_config(hass, CONF_STARTUP_DELAY, 0)
         await async_schedule_refresh_states(hass, startup_delay)
 
-    async def async_on_configuration_changed(event):
+    @callback
+    def async_on_configuration_changed(event):
+        """Force parsing after a service call which reloads HA configuration."""
+        entry = get_entry(hass)
+        entry.runtime_data.force_parsing = True
+        entry.runtime_data.parse_reason = (
+            f"{event.data['domain']}.{event.data['service']} call"
+        )
+        entry.runtime_data.coordinator.async_schedule_refresh()
+
+    @callback
+    def async_on_configuration_reloaded(event):
+        """Force parsing after automations or scenes were reloaded."""
         entry = get_entry(hass)
-        event_type = event.event_type
-        if event_type == EVENT_CALL_SERVICE:
-            domain = event.data.get("domain", None)
-            service = event.data.get("service", None)
-            if domain in TRACKED_EVENT_DOMAINS and service in [
-                SERVICE_RELOAD_CORE_CONFIG,
-                SERVICE_RELOAD,
-                SERVICE_RELOAD_ALL,
-            ]:
-                entry.runtime_data.force_parsing = True
-                entry.runtime_data.parse_reason = f"{domain}.{service} call"
-                await entry.runtime_data.coordinator.async_refresh()
-
-        elif event_type in [EVENT_AUTOMATION_RELOADED, EVENT_SCENE_RELOADED]:
-            entry.runtime_data.force_parsing = True
-            entry.runtime_data.parse_reason = f"event: {event_type}"
-            await entry.runtime_data.coordinator.async_refresh()
-
-    async def async_on_service_changed(event):
+        entry.runtime_data.force_parsing = True
+        entry.runtime_data.parse_reason = f"event: {event.event_type}"
+        entry.runtime_data.coordinator.async_schedule_refresh()
+
+    @callback
+    def async_on_service_changed(event):
         service = f"{event.data['domain']}.{event.data['service']}"
         if service in hass.data[DOMAIN].get(HASS_DATA_PARSED_SERVICE_LIST, []):
             _LOGGER.debug("Monitored service changed: %s", service)
             coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
-            await coordinator.async_refresh()
-
-    async def async_on_state_changed(event):
-        """Refresh monitored entities on state change."""
-
-        def state_or_missing(state_id):
-            """Return missing state if entity not found."""
-            return "missing" if not event.data[state_id] else event.data[state_id].state
-
-        if event.data["entity_id"] in hass.data[DOMAIN].get(
-            HASS_DATA_PARSED_ENTITY_LIST, []
+            coordinator.async_schedule_refresh()
+
+    @callback
+    def monitored_state_filter(event_data) -> bool:
+        """Filter out state changes which cannot affect watchman report.
+
+        Filter runs for every state change in HA before a job is scheduled
+        for the listener, so it should be as cheap as possible.
+        """
+        old_state = _state_or_missing(event_data["old_state"])
+        new_state = _state_or_missing(event_data["new_state"])
+        if old_state == new_state:
+            # attributes only change, entity status remains the same
+            return False
+        if event_data["entity_id"] not in hass.data[DOMAIN].get(
+            HASS_DATA_PARSED_ENTITY_LIST, ()
         ):
-            ignored_states: list[str] = get_config(hass, CONF_IGNORED_STATES, [])
-            old_state = state_or_missing("old_state")
-            new_state = state_or_missing("new_state")
-            checked_states = set(MONITORED_STATES) - set(ignored_states)
-            if new_state in checked_states or old_state in checked_states:
-                _LOGGER.debug("Monitored entity changed: %s", event.data["entity_id"])
-                coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
-                await coordinator.async_refresh()
-
-    # hass is not started yet, schedule config parsing once it loaded
-    if not hass.is_running:
-        hass.bus.async_listen_once(
-            EVENT_HOMEASSISTANT_STARTED, async_on_home_assistant_started
+            return False
+        ignored_states: list[str] = get_config(hass, CONF_IGNORED_STATES, [])
+        return (new_state in _MONITORED_STATES and new_state not in ignored_states) or (
+            old_state in _MONITORED_STATES and old_state not in ignored_states
         )
 
-    hdlr = []
-    hdlr.append(
-        # track service calls which update HA configuration
-        hass.bus.async_listen(EVENT_CALL_SERVICE, async_on_configuration_changed)
-    )
-    hdlr.append(
-        hass.bus.async_listen(EVENT_AUTOMATION_RELOADED, async_on_configuration_changed)
-    )
-    hdlr.append(
-        hass.bus.async_listen(EVENT_SCENE_RELOADED, async_on_configuration_changed)
-    )
-    hdlr.append(
-        hass.bus.async_listen(EVENT_SERVICE_REGISTERED, async_on_service_changed)
-    )
-    hdlr.append(hass.bus.async_listen(EVENT_SERVICE_REMOVED, async_on_service_changed))
-    hdlr.append(hass.bus.async_listen(EVENT_STATE_CHANGED, async_on_state_changed))
-    hass.data[DOMAIN][HASS_DATA_CANCEL_HANDLERS] = hdlr
+    @callback
+    def async_on_state_changed(event):
+        """Refresh monitored entities on state change."""
+        _LOGGER.debug("Monitored entity changed: %s", event.data["entity_id"])
+        coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+        coordinator.async_schedule_refresh(event.data["entity_id"])
+
+    # handlers are stored before they are added, so they are cancelled
+    # on unload even if adding of the rest of them has failed
+    hdlr = hass.data[DOMAIN].setdefault(HASS_DATA_CANCEL_HANDLERS, [])
+    try:
+        # hass is not started yet, schedule config parsing once it loaded
+        if not hass.is_running:
+            cancel_on_started = hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STARTED, async_on_home_assistant_started
+            )
+            hdlr.append(cancel_on_started)
+        hdlr.append(
+            # track service calls which update HA configuration
+            hass.bus.async_listen(
+                EVENT_CALL_SERVICE,
+                async_on_configuration_changed,
+                event_filter=_reload_service_filter,
+            )
+        )
+        hdlr.append(
+            hass.bus.async_listen(
+                EVENT_AUTOMATION_RELOADED, async_on_configuration_reloaded
+            )
+        )
+        hdlr.append(
+            hass.bus.async_listen(EVENT_SCENE_RELOADED, async_on_configuration_reloaded)
+        )
+        hdlr.append(
+            hass.bus.async_listen(EVENT_SERVICE_REGISTERED, async_on_service_changed)
+        )
+        hdlr.append(
+            hass.bus.async_listen(EVENT_SERVICE_REMOVED, async_on_service_changed)
+        )
+        hdlr.append(
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                async_on_state_changed,
+                event_filter=monitored_state_filter,
+            )
+        )
+    except Exception:
+        # setup failed, async_unload_entry won't be called to cancel them
+        while hdlr:
+            hdlr.pop()()
+        raise
 
 
 async def async_migrate_entry(hass, config_entry: ConfigEntry):
@@ -245,7 +308,7 @@ async def async_migrate_entry(hass, config_entry: ConfigEntry):
             "Start Watchman configuration entry migration to version 2. Source data: %s",
             config_entry.options,
         )
-        data = DEFAULT_OPTIONS
+        data = deepcopy(DEFAULT_OPTIONS)
 
         data[CONF_INCLUDED_FOLDERS] = (
             hass.config.path()
@@ -1,5 +1,7 @@
 """ConfigFlow definition for Watchman."""
 
+from copy import deepcopy
+import os
 from types import MappingProxyType
 from typing import Any, Dict
 from homeassistant.config_entries import (
@@ -12,8 +14,7 @@ from homeassistant import data_entry_flow
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, selector
 import voluptuous as vol
-import anyio
-from .utils.utils import async_is_valid_path, get_val
+from .utils.utils import get_val, is_valid_path, to_lists
 
 from .utils.logger import _LOGGER
 
@@ -38,14 +39,16 @@ from .const import (
 )
 
 
-INCLUDED_FOLDERS_SCHEMA = vol.Schema(vol.All(cv.ensure_list, [cv.string]))
-IGNORED_ITEMS_SCHEMA = vol.Schema(vol.All(cv.ensure_list, [cv.string]))
-IGNORED_STATES_SCHEMA = vol.Schema(MONITORED_STATES)
-IGNORED_FILES_SCHEMA = vol.Schema(vol.All(cv.ensure_list, [cv.string]))
+STRING_LIST_SCHEMA = vol.Schema(vol.All(cv.ensure_list, [cv.string]))
+INCLUDED_FOLDERS_SCHEMA = STRING_LIST_SCHEMA
+IGNORED_ITEMS_SCHEMA = STRING_LIST_SCHEMA
+IGNORED_STATES_SCHEMA = vol.Schema(list(MONITORED_STATES))
+IGNORED_STATES_SELECTOR = cv.multi_select(MONITORED_STATES)
+IGNORED_FILES_SCHEMA = STRING_LIST_SCHEMA
 COLUMNS_WIDTH_SCHEMA = vol.Schema(vol.All(cv.ensure_list, [cv.positive_int]))
 
 
-def _get_data_schema() -> vol.Schema:
+def _build_data_schema() -> vol.Schema:
     select = selector.TextSelector(selector.TextSelectorConfig(multiline=True))
     return vol.Schema(
         {
@@ -57,7 +60,7 @@ def _get_data_schema() -> vol.Schema:
             ): select,
             vol.Optional(
                 CONF_IGNORED_STATES,
-            ): cv.multi_select(MONITORED_STATES),
+            ): IGNORED_STATES_SELECTOR,
             vol.Optional(
                 CONF_IGNORED_FILES,
             ): select,
@@ -90,50 +93,78 @@ def _get_data_schema() -> vol.Schema:
     )
 
 
+# form schema is immutable, add_suggested_values_to_schema makes its own copy
+DATA_SCHEMA = _build_data_schema()
+
+
+def _check_paths(
+    folders: list[str], report_path: str | None
+) -> tuple[str | None, bool]:
+    """Return first missing folder and validity of the report path.
+
+    Both checks are done in one go to save executor round trips.
+    """
+    missing_folder = next((path for path in folders if not os.path.isdir(path)), None)
+    return missing_folder, report_path is None or is_valid_path(report_path)
+
+
 async def _async_validate_input(
     hass: HomeAssistant,
     user_input: dict[str, Any],
+    entry_data: MappingProxyType[str, Any] | None = None,
 ) -> tuple[MappingProxyType[str, str], MappingProxyType[str, str]]:
+    """Validate user input, paths equal to ones in entry_data are not checked again."""
     errors: Dict[str, str] = {}
     placeholders: Dict[str, str] = {}
+    entry_data = entry_data or {}
+
+    included_folders_list = []
+    included_folders = user_input.get(CONF_INCLUDED_FOLDERS)
+    if included_folders is not None and included_folders != entry_data.get(
+        CONF_INCLUDED_FOLDERS
+    ):
+        included_folders_list = INCLUDED_FOLDERS_SCHEMA(
+            to_lists(user_input, CONF_INCLUDED_FOLDERS)
+        )
+    report_path = None
+    if (
+        CONF_SECTION_APPEARANCE_LOCATION in user_input
+        and CONF_REPORT_PATH in user_input[CONF_SECTION_APPEARANCE_LOCATION]
+    ):
+        report_path = user_input[CONF_SECTION_APPEARANCE_LOCATION][CONF_REPORT_PATH]
+        if report_path == entry_data.get(CONF_SECTION_APPEARANCE_LOCATION, {}).get(
+            CONF_REPORT_PATH
+        ):
+            report_path = None
+
+    missing_folder, report_path_valid = None, True
+    if included_folders_list or report_path is not None:
+        missing_folder, report_path_valid = await hass.async_add_executor_job(
+            _check_paths, included_folders_list, report_path
+        )
 
     # check user supplied folders
-    if CONF_INCLUDED_FOLDERS in user_input:
-        included_folders_list = [
-            x.strip() for x in user_input[CONF_INCLUDED_FOLDERS].split(",") if x.strip()
-        ]
-        for path in included_folders_list:
-            if not await anyio.Path(path.strip()).exists():
-                errors |= {
-                    CONF_INCLUDED_FOLDERS: "{} is not a valid path ".format(path)
-                }
-                placeholders["path"] = path
-                break
+    if missing_folder is not None:
+        errors[CONF_INCLUDED_FOLDERS] = "invalid_included_folder"
+        placeholders["path"] = missing_folder
 
     columns_width = get_val(
         user_input, CONF_COLUMNS_WIDTH, CONF_SECTION_APPEARANCE_LOCATION
     )
     if columns_width:
         try:
-            columns_width = [int(x) for x in columns_width.split(",") if x.strip()]
+            # int() tolerates surrounding whitespace, only empty items are skipped
+            columns_width = list(filter(str.strip, columns_width.split(",")))
             if len(columns_width) != 3:
                 raise ValueError()
-            columns_width = COLUMNS_WIDTH_SCHEMA(columns_width)
+            columns_width = COLUMNS_WIDTH_SCHEMA(list(map(int, columns_width)))
         except (ValueError, vol.Invalid):
             errors["base"] = "invalid_columns_width"
 
-    if (
-        CONF_SECTION_APPEARANCE_LOCATION in user_input
-        and CONF_REPORT_PATH in user_input[CONF_SECTION_APPEARANCE_LOCATION]
-    ):
-        report_path = user_input[CONF_SECTION_APPEARANCE_LOCATION][CONF_REPORT_PATH]
-        if not await async_is_valid_path(report_path):
-            errors["base"] = "invalid_report_path"
+    if not report_path_valid:
+        errors["base"] = "invalid_report_path"
 
-    return (
-        MappingProxyType[str, str](errors),
-        MappingProxyType[str, str](placeholders),
-    )
+    return MappingProxyType(errors), MappingProxyType(placeholders)
 
 
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -145,12 +176,11 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input=None) -> ConfigFlowResult:
         """Create new Watchman entry via UI."""
         _LOGGER.debug("::async_step_user::")
-        options = DEFAULT_OPTIONS
+        options = deepcopy(DEFAULT_OPTIONS)
         options[CONF_SECTION_APPEARANCE_LOCATION][CONF_REPORT_PATH] = (
             self.hass.config.path(DEFAULT_REPORT_FILENAME)
         )
         options[CONF_INCLUDED_FOLDERS] = self.hass.config.path()
-        options[CONF_IGNORED_FILES] = DEFAULT_OPTIONS[CONF_IGNORED_FILES]
         return self.async_create_entry(title="Watchman", data=options)
 
     @staticmethod
@@ -168,15 +198,6 @@ class OptionsFlowHandler(OptionsFlow):
     # _LOGGER.debug("::OptionsFlowHandler.__init::")
     # self.config_entry = config_entry
 
-    async def async_get_key_in_section(self, data, key, section=None):
-        """Return value of a key in ConfigEntry.data."""
-        if section:
-            if section in data:
-                return section[data].get(key, None)
-        else:
-            return data.get(key, None)
-        return None
-
     async def async_step_init(self, user_input=None) -> ConfigFlowResult:
         """Manage the options form.
 
@@ -191,7 +212,9 @@ class OptionsFlowHandler(OptionsFlow):
         )
 
         if user_input is not None:  # we asked to validate values entered by user
-            errors, placeholders = await _async_validate_input(self.hass, user_input)
+            errors, placeholders = await _async_validate_input(
+                self.hass, user_input, self.config_entry.data
+            )
             if not errors:
                 # if user cleared up `ignored files` or `ignored items` form fields
                 # user_input dict dict will not contain these keys, so we add them explicitly
@@ -209,8 +232,10 @@ class OptionsFlowHandler(OptionsFlow):
 
                 # see met.no code, without update_entry the EXISTING entry
                 # will not be updated with user input, but entry.options will do
+                data = dict(self.config_entry.data)
+                data.update(user_input)
                 self.hass.config_entries.async_update_entry(
-                    self.config_entry, data={**self.config_entry.data, **user_input}
+                    self.config_entry, data=data
                 )
                 # await self.hass.config_entries.async_reload(self.config_entry.entry_id)
                 return self.async_create_entry(title="", data={})
@@ -225,7 +250,7 @@ class OptionsFlowHandler(OptionsFlow):
                 return self.async_show_form(
                     step_id="init",
                     data_schema=self.add_suggested_values_to_schema(
-                        _get_data_schema(),
+                        DATA_SCHEMA,
                         user_input,
                     ),
                     errors=dict(errors),
@@ -235,7 +260,7 @@ class OptionsFlowHandler(OptionsFlow):
         return self.async_show_form(
             step_id="init",
             data_schema=self.add_suggested_values_to_schema(
-                _get_data_schema(),
+                DATA_SCHEMA,
                 self.config_entry.data,
             ),
         )
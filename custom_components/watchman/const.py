@@ -21,17 +21,16 @@ HASS_DATA_PARSED_SERVICE_LIST = "service_list"
 HASS_DATA_FILES_PARSED = "files_parsed"
 HASS_DATA_FILES_IGNORED = "files_ignored"
 HASS_DATA_PARSE_DURATION = "parse_duration"
+HASS_DATA_PARSE_CACHE = "parse_cache"
 HASS_DATA_CANCEL_HANDLERS = "cancel_handlers"
 HASS_DATA_COORDINATOR = "coordinator"
 HASS_DATA_MISSING_ENTITIES = "entities_missing"
 HASS_DATA_MISSING_SERVICES = "services_missing"
 HASS_DATA_CHECK_DURATION = "check_duration"
-
-COORD_DATA_MISSING_ENTITIES = "entities_missing"
-COORD_DATA_MISSING_SERVICES = "services_missing"
-COORD_DATA_LAST_UPDATE = "last_update"
-COORD_DATA_SERVICE_ATTRS = "service_attrs"
-COORD_DATA_ENTITY_ATTRS = "entity_attrs"
+HASS_DATA_RENDER_CACHE = "render_cache"
+HASS_DATA_CONFIG_SNAPSHOT = "config_snapshot"
+HASS_DATA_FILL_CACHE = "fill_cache"
+HASS_DATA_IGNORED_STATES = "ignored_states"
 
 REPORT_ENTRY_TYPE_SERVICE = "service_list"
 REPORT_ENTRY_TYPE_ENTITY = "entity_list"
@@ -55,15 +54,17 @@ CONF_COLUMNS_WIDTH = "columns_width"
 CONF_STARTUP_DELAY = "startup_delay"
 CONF_FRIENDLY_NAMES = "friendly_names"
 # configuration parameters allowed in watchman.report service data
-CONF_ALLOWED_SERVICE_PARAMS = [
-    CONF_SERVICE_NAME,
-    CONF_ACTION_NAME,
-    CONF_CHUNK_SIZE,
-    CONF_CREATE_FILE,
-    CONF_SEND_NOTIFICATION,
-    CONF_PARSE_CONFIG,
-    CONF_SERVICE_DATA,
-]
+CONF_ALLOWED_SERVICE_PARAMS = frozenset(
+    {
+        CONF_SERVICE_NAME,
+        CONF_ACTION_NAME,
+        CONF_CHUNK_SIZE,
+        CONF_CREATE_FILE,
+        CONF_SEND_NOTIFICATION,
+        CONF_PARSE_CONFIG,
+        CONF_SERVICE_DATA,
+    }
+)
 
 CONF_SECTION_APPEARANCE_LOCATION = "appearance_location_options"
 CONF_SECTION_NOTIFY_ACTION = "notify_action_options"
@@ -75,31 +76,36 @@ SENSOR_LAST_UPDATE = "watchman_last_updated"
 SENSOR_MISSING_ENTITIES = "watchman_missing_entities"
 SENSOR_MISSING_SERVICES = "watchman_missing_services"
 SENSOR_MISSING_ACTIONS = "watchman_missing_actions"
-MONITORED_STATES = ["unavailable", "unknown", "missing", "disabled"]
-
-TRACKED_EVENT_DOMAINS = [
-    "homeassistant",
-    "input_boolean",
-    "input_button",
-    "input_select",
-    "input_number",
-    "input_datetime",
-    "person",
-    "input_text",
-    "script",
-    "timer",
-    "zone",
-]
-
-BUNDLED_IGNORED_ITEMS = [
-    "timer.cancelled",
-    "timer.finished",
-    "timer.started",
-    "timer.restarted",
-    "timer.paused",
-    "event.*",
-    "date.*",
-]
+# tuple keeps the order of options in the ignored states selector
+MONITORED_STATES = ("unavailable", "unknown", "missing", "disabled")
+
+TRACKED_EVENT_DOMAINS = frozenset(
+    {
+        "homeassistant",
+        "input_boolean",
+        "input_button",
+        "input_select",
+        "input_number",
+        "input_datetime",
+        "person",
+        "input_text",
+        "script",
+        "timer",
+        "zone",
+    }
+)
+
+BUNDLED_IGNORED_ITEMS = frozenset(
+    {
+        "timer.cancelled",
+        "timer.finished",
+        "timer.started",
+        "timer.restarted",
+        "timer.paused",
+        "event.*",
+        "date.*",
+    }
+)
 
 # Platforms
 PLATFORMS = [Platform.SENSOR]
@@ -144,3 +150,10 @@ DEFAULT_HA_DOMAINS = [
 
 # Watchman will ignore lines started from these words followed by :
 PARSER_STOP_WORDS = ["description", "example", "icon", "title"]
+
+# max number of files scanned concurrently in the executor
+PARSER_MAX_JOBS = 4
+# max number of changed entities rechecked without yielding to the event loop
+DIRTY_ENTITIES_CHUNK_SIZE = 500
+# max number of parsed entities checked without yielding to the event loop
+CHECK_CHUNK_SIZE = 500
@@ -2,41 +2,71 @@
 
 import time
 import asyncio
-from token import INDENT
+from dataclasses import dataclass, replace
+from datetime import datetime
 from typing import Any
+from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .utils.report import fill
 from .utils.parser import parse_config
 from .const import (
-    COORD_DATA_ENTITY_ATTRS,
-    COORD_DATA_LAST_UPDATE,
-    COORD_DATA_MISSING_ENTITIES,
-    COORD_DATA_MISSING_SERVICES,
-    COORD_DATA_SERVICE_ATTRS,
+    CHECK_CHUNK_SIZE,
+    DIRTY_ENTITIES_CHUNK_SIZE,
     DOMAIN,
     HASS_DATA_CHECK_DURATION,
+    HASS_DATA_FILL_CACHE,
     HASS_DATA_MISSING_ENTITIES,
     HASS_DATA_MISSING_SERVICES,
     HASS_DATA_PARSED_ENTITY_LIST,
     HASS_DATA_PARSED_SERVICE_LIST,
 )
 from .utils.utils import (
-    renew_missing_entities_list,
-    renew_missing_actions_list,
-    get_entity_state,
-    get_entry,
+    async_check_missing,
+    get_friendly_name,
+    update_missing_entities,
 )
-from .utils.logger import _LOGGER
+from .utils.logger import _LOGGER, INDENT
 
 parser_lock = asyncio.Lock()
 
 
+@dataclass(frozen=True, slots=True)
+class CoordinatorData:
+    """Data shared by the coordinator with Watchman sensors.
+
+    last_update takes part in comparison, so every completed check notifies
+    sensors and last updated sensor shows the time of the last check. When only
+    the timestamp is renewed, attribute lists are kept as the same objects and
+    missing entities/actions sensors skip writing their unchanged state.
+    """
+
+    missing_entities: int
+    missing_services: int
+    last_update: datetime
+    service_attrs: list[dict[str, Any]]
+    entity_attrs: list[dict[str, Any]]
+
+
+def cached_fill(fill_cache, parsed_list, item):
+    """Return occurrences of item arranged by fill().
+
+    Parser replaces parsed lists on every run, so cached text is reused
+    until the parsed list it was built from is renewed.
+    """
+    cached = fill_cache.get(item)
+    if cached and cached[0] is parsed_list:
+        return cached[1]
+    occurrences = fill(parsed_list[item], 0)
+    fill_cache[item] = (parsed_list, occurrences)
+    return occurrences
+
+
 class WatchmanCoordinator(DataUpdateCoordinator):
     """My custom coordinator."""
 
-    def __init__(self, hass, logger, name):
+    def __init__(self, hass, logger, name, config_entry):
         """Initialize watchmman coordinator."""
         super().__init__(
             hass,
@@ -46,99 +76,199 @@ class WatchmanCoordinator(DataUpdateCoordinator):
         )
 
         self.hass = hass
-        self.data = {
-            COORD_DATA_MISSING_ENTITIES: 0,
-            COORD_DATA_MISSING_SERVICES: 0,
-            COORD_DATA_LAST_UPDATE: dt_util.now(),
-            COORD_DATA_SERVICE_ATTRS: "",
-            COORD_DATA_ENTITY_ATTRS: "",
-        }
+        # entry outlives the coordinator, no need to look it up on every refresh
+        self.config_entry = config_entry
+        self.data = CoordinatorData(
+            missing_entities=0,
+            missing_services=0,
+            last_update=dt_util.now(),
+            service_attrs=[],
+            entity_attrs=[],
+        )
+        # entities changed since last update, see async_schedule_refresh
+        self._dirty_entities: set[str] = set()
+        self._incremental_refresh = False
+        self._refresh_scheduled = False
+        self._full_refresh_requested = False
+        # states of missing entities found by triage, reused for sensor attributes
+        self._entity_states: dict[str, str] = {}
+
+    @callback
+    def async_schedule_refresh(self, entity_id: str | None = None) -> None:
+        """Schedule refresh of sensors, requests made before it starts are coalesced.
+
+        When all coalesced requests name an entity, only these entities are
+        rechecked, otherwise all parsed entities and actions are checked.
+        """
+        if entity_id is None:
+            self._full_refresh_requested = True
+        else:
+            self._dirty_entities.add(entity_id)
+        self._async_schedule_task()
+
+    @callback
+    def _async_schedule_task(self) -> None:
+        """Create refresh task unless one is already waiting to start."""
+        if self._refresh_scheduled:
+            return
+        self._refresh_scheduled = True
+        self.hass.async_create_task(self._async_scheduled_refresh(), eager_start=False)
+
+    async def _async_scheduled_refresh(self) -> None:
+        """Run refresh scheduled by async_schedule_refresh."""
+        self._refresh_scheduled = False
+        self._incremental_refresh = not self._full_refresh_requested
+        self._full_refresh_requested = False
+        # refresh after unload is skipped by DataUpdateCoordinator itself
+        await self.async_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Release per-entity data on unload."""
+        await super().async_shutdown()
+        self._dirty_entities.clear()
+        self._entity_states.clear()
 
     async def _async_setup(self) -> None:
         """Do initialization logic."""
         _LOGGER.debug("::coordinator._async_setup::")
         if self.hass.is_running:
             # integration reloaded or options changed via UI
-            _LOGGER.debug(f"{INDENT} hass up and running, try to parse config")
+            _LOGGER.debug("%shass up and running, try to parse config", INDENT)
             await parse_config(self.hass, reason="changes in watchman configuration")
         else:
-            _LOGGER.debug(f"{INDENT} hass is still loading, do nothing yet")
+            _LOGGER.debug("%shass is still loading, do nothing yet", INDENT)
             # first run, home assistant still loading
             # parse_config will be scheduled once HA is fully loaded
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> CoordinatorData:
         """Update Watchman sensors.
 
         Update will trigger parsing of configuration files if entry.runtime_data.force_parsing is set
         """
 
-        if not parser_lock.locked():
+        incremental, self._incremental_refresh = self._incremental_refresh, False
+        if parser_lock.locked():
+            # check is in progress, keep sensors at their last known values
+            # and run this refresh again once the lock is released
+            if not incremental:
+                self._full_refresh_requested = True
+            return self.data
+
+        try:
             async with parser_lock:
-                entry = get_entry(self.hass)
-                _LOGGER.debug(
-                    f"::coordinator._async_update_data:: force_parsing {entry.runtime_data.force_parsing}, parse_reason: {entry.runtime_data.parse_reason}"
+                return await self._async_check(incremental)
+        finally:
+            if self._full_refresh_requested or self._dirty_entities:
+                # refreshes requested while the check was running could not
+                # take the lock, they are served now
+                self._async_schedule_task()
+
+    async def _async_check(self, incremental: bool) -> CoordinatorData:
+        """Check parsed entities and actions, parser_lock is held by the caller."""
+        entry = self.config_entry
+        _LOGGER.debug(
+            "::coordinator._async_update_data:: force_parsing %s, parse_reason: %s",
+            entry.runtime_data.force_parsing,
+            entry.runtime_data.parse_reason,
+        )
+
+        # entities changed after this point are rechecked by the next refresh
+        dirty_entities, self._dirty_entities = self._dirty_entities, set()
+        if not self.hass.is_running:
+            return self.data
+
+        parsed = entry.runtime_data.force_parsing
+        if parsed:
+            await parse_config(self.hass, reason=entry.runtime_data.parse_reason)
+            entry.runtime_data.force_parsing = False
+        hass = self.hass
+        watchman_data = hass.data[DOMAIN]
+        start_time = time.monotonic()
+        previous_entities = watchman_data.get(HASS_DATA_MISSING_ENTITIES)
+        previous_services = watchman_data.get(HASS_DATA_MISSING_SERVICES)
+        if incremental and not parsed and previous_entities is not None:
+            services_missing = previous_services
+            entities_missing = previous_entities
+            dirty_entities = list(dirty_entities)
+            for i in range(0, len(dirty_entities), DIRTY_ENTITIES_CHUNK_SIZE):
+                if i:
+                    # let event loop breathe during mass state changes
+                    await asyncio.sleep(0)
+                entities_missing = update_missing_entities(
+                    hass,
+                    entities_missing,
+                    dirty_entities[i : i + DIRTY_ENTITIES_CHUNK_SIZE],
+                    self._entity_states,
                 )
+            # update_missing_entities returns the same dict if nothing changed
+            unchanged = entities_missing is previous_entities
+        else:
+            previous_states, self._entity_states = self._entity_states, {}
+            services_missing, entities_missing = await async_check_missing(
+                hass, CHECK_CHUNK_SIZE, self._entity_states
+            )
+            unchanged = (
+                not parsed
+                and entities_missing == previous_entities
+                and services_missing == previous_services
+                and self._entity_states == previous_states
+            )
+            if unchanged:
+                # keep previous dicts so caches keyed on them stay valid
+                entities_missing = previous_entities
+                services_missing = previous_services
+        watchman_data[HASS_DATA_CHECK_DURATION] = time.monotonic() - start_time
+        watchman_data[HASS_DATA_MISSING_ENTITIES] = entities_missing
+        watchman_data[HASS_DATA_MISSING_SERVICES] = services_missing
+
+        if unchanged or (
+            not entities_missing
+            and not services_missing
+            and not self.data.missing_entities
+            and not self.data.missing_services
+        ):
+            # missing entities, actions and their states are the same as
+            # on previous refresh, only the timestamp is renewed
+            self.data = replace(self.data, last_update=dt_util.now())
+            return self.data
+
+        fill_cache = watchman_data.setdefault(HASS_DATA_FILL_CACHE, {})
+
+        # build entity attributes map for missing_entities sensor, friendly
+        # names option only applies to the text report
+        parsed_entity_list = watchman_data[HASS_DATA_PARSED_ENTITY_LIST]
+        entity_states = self._entity_states
+        entity_attrs = [
+            {
+                "id": entity,
+                "state": entity_states[entity],
+                "friendly_name": get_friendly_name(hass, entity) or "",
+                "occurrences": cached_fill(fill_cache, parsed_entity_list, entity),
+            }
+            for entity in entities_missing
+        ]
+
+        # build service attributes map for missing_services sensor
+        parsed_service_list = watchman_data[HASS_DATA_PARSED_SERVICE_LIST]
+        service_attrs = [
+            {
+                "id": service,
+                "occurrences": cached_fill(fill_cache, parsed_service_list, service),
+            }
+            for service in services_missing
+        ]
+
+        self.data = CoordinatorData(
+            missing_entities=len(entities_missing),
+            missing_services=len(services_missing),
+            last_update=dt_util.now(),
+            service_attrs=service_attrs,
+            entity_attrs=entity_attrs,
+        )
+        _LOGGER.debug(
+            "::coordinator:: Watchman sensors updated, actions: %s, entities: %s",
+            self.data.missing_services,
+            self.data.missing_entities,
+        )
 
-                if self.hass.is_running:
-                    if entry.runtime_data.force_parsing:
-                        await parse_config(
-                            self.hass, reason=entry.runtime_data.parse_reason
-                        )
-                        entry.runtime_data.force_parsing = False
-                    start_time = time.time()
-                    services_missing = renew_missing_actions_list(self.hass)
-                    entities_missing = renew_missing_entities_list(self.hass)
-                    self.hass.data[DOMAIN][HASS_DATA_CHECK_DURATION] = (
-                        time.time() - start_time
-                    )
-                    self.hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES] = (
-                        entities_missing
-                    )
-                    self.hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES] = (
-                        services_missing
-                    )
-
-                    # build entity attributes map for missing_entities sensor
-                    entity_attrs = []
-                    parsed_entity_list = self.hass.data[DOMAIN][
-                        HASS_DATA_PARSED_ENTITY_LIST
-                    ]
-                    for entity in entities_missing:
-                        state, name = get_entity_state(
-                            self.hass, entity, friendly_names=True
-                        )
-                        entity_attrs.append(
-                            {
-                                "id": entity,
-                                "state": state,
-                                "friendly_name": name or "",
-                                "occurrences": fill(parsed_entity_list[entity], 0),
-                            }
-                        )
-
-                    # build service attributes map for missing_services sensor
-                    service_attrs = []
-                    parsed_service_list = self.hass.data[DOMAIN][
-                        HASS_DATA_PARSED_SERVICE_LIST
-                    ]
-                    for service in services_missing:
-                        service_attrs.append(
-                            {
-                                "id": service,
-                                "occurrences": fill(parsed_service_list[service], 0),
-                            }
-                        )
-
-                    self.data = {
-                        COORD_DATA_MISSING_ENTITIES: len(entities_missing),
-                        COORD_DATA_MISSING_SERVICES: len(services_missing),
-                        COORD_DATA_LAST_UPDATE: dt_util.now(),
-                        COORD_DATA_SERVICE_ATTRS: service_attrs,
-                        COORD_DATA_ENTITY_ATTRS: entity_attrs,
-                    }
-                    _LOGGER.debug(
-                        f"::coordinator:: Watchman sensors updated, actions: {self.data[COORD_DATA_MISSING_SERVICES]}, entities: {self.data[COORD_DATA_MISSING_ENTITIES]}"
-                    )
-
-                    return self.data
-        return {}
+        return self.data
@@ -8,6 +8,17 @@ from homeassistant.helpers.update_coordinator import (
 )
 from .const import DOMAIN, VERSION
 
+# all watchman sensors belong to the same service device
+DEVICE_INFO = DeviceInfo(
+    identifiers={(DOMAIN, "watchman_unique_id")},
+    manufacturer="dummylabs",
+    model="Watchman",
+    name="Watchman",
+    sw_version=VERSION,
+    entry_type=DeviceEntryType.SERVICE,
+    configuration_url="https://github.com/dummylabs/thewatchman",
+)
+
 
 class WatchmanEntity(CoordinatorEntity):
     """Representation of a Watchman entity."""
@@ -24,13 +35,5 @@ class WatchmanEntity(CoordinatorEntity):
         self._attr_unique_id = (
             f"{coordinator.config_entry.entry_id}_{entity_description.key}"
         )
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, "watchman_unique_id")},
-            manufacturer="dummylabs",
-            model="Watchman",
-            name="Watchman",
-            sw_version=VERSION,
-            entry_type=DeviceEntryType.SERVICE,
-            configuration_url="https://github.com/dummylabs/thewatchman",
-        )
+        self._attr_device_info = DEVICE_INFO
         self._attr_extra_state_attributes = {}
@@ -15,11 +15,6 @@ from homeassistant.const import MATCH_ALL
 from .entity import WatchmanEntity
 
 from .const import (
-    COORD_DATA_ENTITY_ATTRS,
-    COORD_DATA_LAST_UPDATE,
-    COORD_DATA_MISSING_ENTITIES,
-    COORD_DATA_MISSING_SERVICES,
-    COORD_DATA_SERVICE_ATTRS,
     DOMAIN,
     SENSOR_LAST_UPDATE,
     SENSOR_MISSING_ACTIONS,
@@ -84,7 +79,7 @@ class LastUpdateSensor(WatchmanEntity, SensorEntity):
     def native_value(self):
         """Return the native value of the sensor."""
         if self.coordinator.data:
-            return self.coordinator.data[COORD_DATA_LAST_UPDATE]
+            return self.coordinator.data.last_update
         else:
             return self._attr_native_value
 
@@ -92,8 +87,7 @@ class LastUpdateSensor(WatchmanEntity, SensorEntity):
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         if self.coordinator.data:
-            self._attr_native_value = self.coordinator.data[COORD_DATA_LAST_UPDATE]
-            self.async_write_ha_state()
+            self._attr_native_value = self.coordinator.data.last_update
         super()._handle_coordinator_update()
 
 
@@ -114,7 +108,7 @@ class MissingEntitiesSensor(WatchmanEntity, SensorEntity):
     def native_value(self):
         """Return the native value of the sensor."""
         if self.coordinator.data:
-            return self.coordinator.data[COORD_DATA_MISSING_ENTITIES]
+            return self.coordinator.data.missing_entities
         else:
             return self._attr_native_value
 
@@ -122,19 +116,24 @@ class MissingEntitiesSensor(WatchmanEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         if self.coordinator.data:
-            return {"entities": self.coordinator.data[COORD_DATA_ENTITY_ATTRS]}
+            return {"entities": self.coordinator.data.entity_attrs}
         else:
             return {}
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            self._attr_native_value = self.coordinator.data[COORD_DATA_MISSING_ENTITIES]
-            self._attr_extra_state_attributes = {
-                "entities": self.coordinator.data[COORD_DATA_ENTITY_ATTRS]
-            }
-            self.async_write_ha_state()
+        data = self.coordinator.data
+        if data:
+            shown_attrs = self._attr_extra_state_attributes.get("entities")
+            if (
+                data.missing_entities == self._attr_native_value
+                and data.entity_attrs is shown_attrs
+            ):
+                # only the timestamp was renewed, state is not rewritten
+                return
+            self._attr_native_value = data.missing_entities
+            self._attr_extra_state_attributes = {"entities": data.entity_attrs}
         super()._handle_coordinator_update()
 
 
@@ -155,7 +154,7 @@ class MissingServicesSensor(WatchmanEntity, SensorEntity):
     def native_value(self):
         """Return the native value of the sensor."""
         if self.coordinator.data:
-            return self.coordinator.data[COORD_DATA_MISSING_SERVICES]
+            return self.coordinator.data.missing_services
         else:
             return self._attr_native_value
 
@@ -163,17 +162,22 @@ class MissingServicesSensor(WatchmanEntity, SensorEntity):
     def extra_state_attributes(self):
         """Return the state attributes."""
         if self.coordinator.data:
-            return {"entities": self.coordinator.data[COORD_DATA_SERVICE_ATTRS]}
+            return {"entities": self.coordinator.data.service_attrs}
         else:
             return {}
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data:
-            self._attr_native_value = self.coordinator.data[COORD_DATA_MISSING_SERVICES]
-            self._attr_extra_state_attributes = {
-                "services": self.coordinator.data[COORD_DATA_SERVICE_ATTRS]
-            }
-        self.async_write_ha_state()
+        data = self.coordinator.data
+        if data:
+            shown_attrs = self._attr_extra_state_attributes.get("services")
+            if (
+                data.missing_services == self._attr_native_value
+                and data.service_attrs is shown_attrs
+            ):
+                # only the timestamp was renewed, state is not rewritten
+                return
+            self._attr_native_value = data.missing_services
+            self._attr_extra_state_attributes = {"services": data.service_attrs}
         super()._handle_coordinator_update()
@@ -1,10 +1,13 @@
 """Watchman parser funcions."""
 
+import asyncio
 import fnmatch
+import hashlib
+import io
 import os
 import re
+import sys
 import time
-import anyio
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
 
@@ -20,9 +23,12 @@ from ..const import (
     DOMAIN,
     HASS_DATA_FILES_IGNORED,
     HASS_DATA_FILES_PARSED,
+    HASS_DATA_FILL_CACHE,
+    HASS_DATA_PARSE_CACHE,
     HASS_DATA_PARSE_DURATION,
     HASS_DATA_PARSED_ENTITY_LIST,
     HASS_DATA_PARSED_SERVICE_LIST,
+    PARSER_MAX_JOBS,
     PARSER_STOP_WORDS,
 )
 
@@ -30,7 +36,7 @@ from ..const import (
 async def parse_config(hass: HomeAssistant, reason=None):
     """Parse home assistant configuration files."""
 
-    start_time = time.time()
+    start_time = time.monotonic()
 
     included_folders = get_included_folders(hass)
     ignored_files = get_config(hass, CONF_IGNORED_FILES, None)
@@ -38,14 +44,17 @@ async def parse_config(hass: HomeAssistant, reason=None):
         f"::parse_config:: called due to {reason} IGNORED_FILES={ignored_files}"
     )
 
+    parse_cache = hass.data[DOMAIN].setdefault(HASS_DATA_PARSE_CACHE, {})
     parsed_entity_list, parsed_service_list, files_parsed, files_ignored = await parse(
-        hass, included_folders, ignored_files, hass.config.config_dir
+        hass, included_folders, ignored_files, hass.config.config_dir, parse_cache
     )
     hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST] = parsed_entity_list
     hass.data[DOMAIN][HASS_DATA_PARSED_SERVICE_LIST] = parsed_service_list
+    # occurrences text built from the previous lists is outdated now
+    hass.data[DOMAIN].pop(HASS_DATA_FILL_CACHE, None)
     hass.data[DOMAIN][HASS_DATA_FILES_PARSED] = files_parsed
     hass.data[DOMAIN][HASS_DATA_FILES_IGNORED] = files_ignored
-    hass.data[DOMAIN][HASS_DATA_PARSE_DURATION] = time.time() - start_time
+    hass.data[DOMAIN][HASS_DATA_PARSE_DURATION] = time.monotonic() - start_time
     _LOGGER.debug(
         f"{INDENT}Parsing took {hass.data[DOMAIN][HASS_DATA_PARSE_DURATION]:.2f}s."
     )
@@ -56,8 +65,12 @@ async def async_get_short_path(yaml_file, root):
     return os.path.relpath(yaml_file, root)
 
 
-async def parse(hass, folders, ignored_files, root_path=None):
-    """Parse a yaml or json file for entities/services."""
+async def parse(hass, folders, ignored_files, root_path=None, cache=None):
+    """Parse a yaml or json file for entities/services.
+
+    If `cache` dict is provided, results of files which were not changed since
+    the previous run are taken from it and the cache is renewed in place.
+    """
     parsed_files_count = 0
     entity_pattern = re.compile(
         r"(?:(?<=\s)|(?<=^)|(?<=\")|(?<=\'))([A-Za-z_0-9]*\s*:)?(?:\s*)?(?:states.)?"
@@ -73,44 +86,75 @@ async def parse(hass, folders, ignored_files, root_path=None):
     parsed_service_list = {}
     parsed_files = []
     effectively_ignored_files = []
-    async for yaml_file, ignored in async_get_next_file(folders, ignored_files):
+    renewed_cache = {}
+    parser_slots = asyncio.Semaphore(PARSER_MAX_JOBS)
+
+    async def async_parse_file(yaml_file, short_path, stat_key):
+        """Scan a file in the executor, return None if it can't be parsed."""
+        async with parser_slots:
+            try:
+                return await hass.async_add_executor_job(
+                    parse_file,
+                    yaml_file,
+                    short_path,
+                    entity_pattern,
+                    service_pattern,
+                    comment_pattern,
+                    cache.get(yaml_file) if cache else None,
+                    stat_key,
+                )
+            except OSError as exception:
+                _LOGGER.error("Unable to parse %s: %s", yaml_file, exception)
+            except UnicodeDecodeError as exception:
+                _LOGGER.error(
+                    "Unable to parse %s: %s. Use UTF-8 encoding to avoid this error",
+                    yaml_file,
+                    exception,
+                )
+            return None
+
+    files_to_parse = []
+    async for yaml_file, ignored, stat_key in async_get_next_file(
+        hass, folders, ignored_files
+    ):
         short_path = await async_get_short_path(yaml_file, root_path)
         if ignored:
             effectively_ignored_files.append(short_path)
+        else:
+            files_to_parse.append((yaml_file, short_path, stat_key))
+
+    # files with unchanged stat are taken from cache without an executor job,
+    # only new and changed files are scanned
+    results = [None] * len(files_to_parse)
+    jobs = {}
+    for idx, (yaml_file, short_path, stat_key) in enumerate(files_to_parse):
+        cached = cache.get(yaml_file) if cache else None
+        if cached and stat_key is not None and cached[0] == stat_key:
+            results[idx] = cached
+        else:
+            jobs[idx] = async_parse_file(yaml_file, short_path, stat_key)
+    for idx, file_entry in zip(jobs, await asyncio.gather(*jobs.values())):
+        results[idx] = file_entry
+    # merge in scan order to keep the first file where an entry was found
+    for (yaml_file, short_path, _), file_entry in zip(files_to_parse, results):
+        if file_entry is None:
             continue
+        renewed_cache[yaml_file] = file_entry
+        _, _, file_entities, file_services = file_entry
+        for entry, occurrences in file_entities.items():
+            parsed_entity_list.setdefault(entry, occurrences)
+        for entry, occurrences in file_services.items():
+            parsed_service_list.setdefault(entry, occurrences)
+        parsed_files_count += 1
+        parsed_files.append(short_path)
+
+    if cache is not None:
+        cache.clear()
+        cache.update(renewed_cache)
 
-        try:
-            lineno = 1
-            async with await anyio.open_file(
-                yaml_file, mode="r", encoding="utf-8"
-            ) as f:
-                async for line in f:
-                    line = re.sub(comment_pattern, "", line)
-                    for match in re.finditer(entity_pattern, line):
-                        typ, val = match.group(1), match.group(2)
-                        if (
-                            typ != "service:"
-                            and "*" not in val
-                            and not val.endswith(".yaml")
-                        ):
-                            add_entry(parsed_entity_list, val, short_path, lineno)
-                    for match in re.finditer(service_pattern, line):
-                        val = match.group(1)
-                        add_entry(parsed_service_list, val, short_path, lineno)
-                    lineno += 1
-            parsed_files_count += 1
-            parsed_files.append(short_path)
-        except OSError as exception:
-            _LOGGER.error("Unable to parse %s: %s", yaml_file, exception)
-        except UnicodeDecodeError as exception:
-            _LOGGER.error(
-                "Unable to parse %s: %s. Use UTF-8 encoding to avoid this error",
-                yaml_file,
-                exception,
-            )
     # remove ignored entities and services from resulting lists
     ignored_items = get_config(hass, CONF_IGNORED_ITEMS, [])
-    ignored_items = list(set(ignored_items + BUNDLED_IGNORED_ITEMS))
+    ignored_items = BUNDLED_IGNORED_ITEMS.union(ignored_items)
     excluded_entities = []
     excluded_services = []
     for itm in ignored_items:
@@ -141,13 +185,63 @@ async def parse(hass, folders, ignored_files, root_path=None):
     )
 
 
+def parse_file(
+    yaml_file,
+    short_path,
+    entity_pattern,
+    service_pattern,
+    comment_pattern,
+    cached=None,
+    stat_key=None,
+):
+    """Scan a single configuration file for entities/services.
+
+    Return (stat_key, content_hash, entities, services) tuple. When `cached`
+    tuple from a previous run is given and the file is unchanged, the file is
+    not scanned again. `stat_key` can be passed if the caller already knows it.
+    This is a blocking function and should be run in the executor.
+    """
+    if stat_key is None:
+        stat = os.stat(yaml_file)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+    if cached and cached[0] == stat_key:
+        return cached
+
+    with open(yaml_file, "rb") as f:
+        content = f.read()
+    content_hash = hashlib.blake2b(content, digest_size=16).hexdigest()
+    if cached and cached[1] == content_hash:
+        return (stat_key, content_hash, cached[2], cached[3])
+
+    file_entities = {}
+    file_services = {}
+    strip_comments = comment_pattern.sub
+    find_entities = entity_pattern.finditer
+    find_services = service_pattern.finditer
+    lines = io.StringIO(content.decode("utf-8"), newline=None)
+    for lineno, line in enumerate(lines, start=1):
+        # both entity and service ids contain a dot, skip regex for other lines
+        if "." not in line:
+            continue
+        line = strip_comments("", line)
+        for match in find_entities(line):
+            typ, val = match.group(1), match.group(2)
+            if typ != "service:" and "*" not in val and not val.endswith(".yaml"):
+                add_entry(file_entities, val, short_path, lineno)
+        for match in find_services(line):
+            val = match.group(1)
+            add_entry(file_services, val, short_path, lineno)
+    return (stat_key, content_hash, file_entities, file_services)
+
+
 def add_entry(_list, entry, yaml_file, lineno):
     """Add entry to list of missing entities/services with line number information."""
     if entry in _list:
         if yaml_file in _list[entry]:
             _list[entry].get(yaml_file, []).append(lineno)
     else:
-        _list[entry] = {yaml_file: [lineno]}
+        # same id is found in many files, share a single string object for it
+        _list[sys.intern(entry)] = {yaml_file: [lineno]}
 
 
 def get_included_folders(hass):
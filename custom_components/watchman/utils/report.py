@@ -1,11 +1,10 @@
 """Reporting function of Watchman."""
 
-from datetime import datetime
 from typing import Any
-import pytz
 from textwrap import wrap
 import time
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.exceptions import HomeAssistantError
 from prettytable import PrettyTable
 from .utils import get_config, get_entity_state, get_entry, is_action
@@ -26,6 +25,7 @@ from ..const import (
     HASS_DATA_PARSE_DURATION,
     HASS_DATA_PARSED_ENTITY_LIST,
     HASS_DATA_PARSED_SERVICE_LIST,
+    HASS_DATA_RENDER_CACHE,
     REPORT_ENTRY_TYPE_ENTITY,
     REPORT_ENTRY_TYPE_SERVICE,
 )
@@ -33,16 +33,12 @@ from ..const import (
 
 async def parsing_stats(hass, start_time):
     """Separate func for test mocking."""
-
-    def get_timezone(hass):
-        return pytz.timezone(hass.config.time_zone)
-
-    timezone = await hass.async_add_executor_job(get_timezone, hass)
+    # dt_util.now() uses time zone from HA configuration
     return (
-        datetime.now(timezone).strftime("%d %b %Y %H:%M:%S"),
+        dt_util.now().strftime("%d %b %Y %H:%M:%S"),
         hass.data[DOMAIN][HASS_DATA_PARSE_DURATION],
         hass.data[DOMAIN][HASS_DATA_CHECK_DURATION],
-        time.time() - start_time,
+        time.monotonic() - start_time,
     )
 
 
@@ -51,7 +47,7 @@ async def report(hass, render, chunk_size):
     if DOMAIN not in hass.data:
         raise HomeAssistantError("No data for report, refresh required.")
 
-    start_time = time.time()
+    start_time = time.monotonic()
     header = get_config(hass, CONF_HEADER, DEFAULT_HEADER)
     services_missing = hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES]
     service_list = hass.data[DOMAIN][HASS_DATA_PARSED_SERVICE_LIST]
@@ -64,9 +60,9 @@ async def report(hass, render, chunk_size):
     if services_missing:
         rep += f"\n-== Missing {len(services_missing)} action(s) from "
         rep += f"{len(service_list)} found in your config:\n"
-        rep += render(hass, REPORT_ENTRY_TYPE_SERVICE)
+        rep += cached_render(hass, render, REPORT_ENTRY_TYPE_SERVICE)
         rep += "\n"
-    elif len(service_list) > 0:
+    elif service_list:
         rep += f"\n-== Congratulations, all {len(service_list)} actions from "
         rep += "your config are available!\n"
     else:
@@ -75,10 +71,10 @@ async def report(hass, render, chunk_size):
     if entities_missing:
         rep += f"\n-== Missing {len(entities_missing)} entity(ies) from "
         rep += f"{len(entity_list)} found in your config:\n"
-        rep += render(hass, REPORT_ENTRY_TYPE_ENTITY)
+        rep += cached_render(hass, render, REPORT_ENTRY_TYPE_ENTITY)
         rep += "\n"
 
-    elif len(entity_list) > 0:
+    elif entity_list:
         rep += f"\n-== Congratulations, all {len(entity_list)} entities from "
         rep += "your config are available!\n"
     else:
@@ -97,11 +93,16 @@ async def report(hass, render, chunk_size):
         f"ignored {files_ignored} files \n"
     )
     rep += f"-== Generated in: {render_duration:.2f}s. Validated in: {check_duration:.2f}s."
+    lines = rep.splitlines()
+    full_report = "\n".join(lines) + "\n"
+    if chunk_size <= 0 or len(full_report) <= chunk_size:
+        # short report, e.g. all items are available, fits into one chunk
+        return [full_report]
     report_chunks = []
     chunk = ""
-    for line in iter(rep.splitlines()):
+    for line in lines:
         chunk += f"{line}\n"
-        if chunk_size > 0 and len(chunk) > chunk_size:
+        if len(chunk) > chunk_size:
             report_chunks.append(chunk)
             chunk = ""
     if chunk:
@@ -109,6 +110,33 @@ async def report(hass, render, chunk_size):
     return report_chunks
 
 
+def cached_render(hass, render, entry_type):
+    """Render report section, reuse previous output if its content is the same.
+
+    Coordinator replaces the dict of missing items when the set of missing items
+    changes, so the dict identity is checked first. Current states and friendly
+    names of missing entities are compared too, as they can change while the
+    set of missing entities remains the same.
+    """
+    if entry_type == REPORT_ENTRY_TYPE_SERVICE:
+        missing_items = hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES]
+        # missing actions are always rendered with "missing" state
+        shown_states = None
+    else:
+        missing_items = hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]
+        friendly_names = get_config(hass, CONF_FRIENDLY_NAMES, False)
+        shown_states = tuple(
+            get_entity_state(hass, entity, friendly_names) for entity in missing_items
+        )
+    render_cache = hass.data[DOMAIN].setdefault(HASS_DATA_RENDER_CACHE, {})
+    cached = render_cache.get((render, entry_type))
+    if cached and cached[0] is missing_items and cached[1] == shown_states:
+        return cached[2]
+    rendered = render(hass, entry_type)
+    render_cache[(render, entry_type)] = (missing_items, shown_states, rendered)
+    return rendered
+
+
 def table_renderer(hass, entry_type):
     """Render ASCII tables in the report."""
     table = PrettyTable()
@@ -206,12 +234,13 @@ async def async_report_to_file(hass, path):
     report_chunks = await report(hass, table_renderer, chunk_size=0)
     await get_entry(hass).runtime_data.coordinator.async_refresh()
 
-    def write(path):
-        with open(path, "w", encoding="utf-8") as report_file:
-            for chunk in report_chunks:
-                report_file.write(chunk)
+    def write(path, content):
+        with open(path, "wb") as report_file:
+            report_file.write(content)
 
-    await hass.async_add_executor_job(write, path)
+    content = "".join(report_chunks).encode("utf-8")
+
+    await hass.async_add_executor_job(write, path, content)
     _LOGGER.debug(f"::async_report_to_file:: Repost saved to {path}")
 
 
@@ -231,8 +260,7 @@ async def async_report_to_notification(
     if not is_action(hass, action_str):
         raise HomeAssistantError(f"{action_str} is not a valid action for notification")
 
-    domain = action_str.split(".")[0]
-    action = ".".join(action_str.split(".")[1:])
+    domain, _, action = action_str.partition(".")
 
     data = {} if service_data is None else service_data
 
@@ -242,6 +270,8 @@ async def async_report_to_notification(
     await coordinator.async_refresh()
     report_chunks = await report(hass, text_renderer, chunk_size)
     for msg_chunk in report_chunks:
-        data["message"] = msg_chunk
-        # blocking=True ensures send order
-        await hass.services.async_call(domain, action, data, blocking=True)
+        # chunks are sent one by one: blocking=True ensures send order,
+        # concurrent calls would deliver report parts shuffled
+        await hass.services.async_call(
+            domain, action, {**data, "message": msg_chunk}, blocking=True
+        )
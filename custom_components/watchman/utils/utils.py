@@ -1,6 +1,6 @@
 """Miscellaneous support functions for Watchman."""
 
-import anyio
+import asyncio
 import re
 import fnmatch
 
@@ -28,11 +28,20 @@ from ..const import (
     CONF_IGNORED_STATES,
     CONF_COLUMNS_WIDTH,
     CONF_FRIENDLY_NAMES,
+    HASS_DATA_CONFIG_SNAPSHOT,
+    HASS_DATA_IGNORED_STATES,
     HASS_DATA_PARSED_ENTITY_LIST,
     HASS_DATA_PARSED_SERVICE_LIST,
     DEFAULT_OPTIONS,
 )
 
+# entity states reported as missing, "unavailable" is shortened by get_entity_state
+REPORTED_STATES = frozenset({"missing", "unknown", "unavail", "disabled"})
+# states shortened by get_entity_state
+STATE_ALIASES = {"unavailable": "unavail"}
+# raw entity states which can make get_entity_state return one of REPORTED_STATES
+CANDIDATE_STATES = frozenset({"unavailable", *REPORTED_STATES})
+
 
 def get_val(
     options: MappingProxyType[str, Any], key: str, section: str | None = None
@@ -48,20 +57,20 @@ def get_val(
             )
             val = DEFAULT_OPTIONS[section][key]
     else:
-        val = options.get(key, DEFAULT_OPTIONS[key])
+        val = options[key] if key in options else DEFAULT_OPTIONS[key]
     return val
 
 
 def to_lists(options, key, section=None):
     """Transform configuration value to the list of strings."""
     val = get_val(options, key, section)
-    return [x.strip() for x in val.split(",") if x.strip()]
+    return [item for x in val.split(",") if (item := x.strip())]
 
 
 def to_listi(options, key, section=None):
     """Transform configuration value to the list of integers."""
     val = get_val(options, key, section)
-    return [int(x) for x in val.split(",") if x.strip()]
+    return list(map(int, filter(str.strip, val.split(","))))
 
 
 def get_entry(hass: HomeAssistant) -> Any:
@@ -72,7 +81,10 @@ def get_entry(hass: HomeAssistant) -> Any:
 
 
 def get_config(hass: HomeAssistant, key: str, default: Any | None = None) -> Any:
-    """Get configuration value from ConfigEntry."""
+    """Get configuration value from ConfigEntry.
+
+    Values are parsed once and cached until ConfigEntry.data is replaced.
+    """
     assert hass.data.get(DOMAIN_DATA)
     entry = hass.config_entries.async_get_entry(
         hass.data[DOMAIN_DATA]["config_entry_id"]
@@ -80,71 +92,132 @@ def get_config(hass: HomeAssistant, key: str, default: Any | None = None) -> Any
 
     assert isinstance(entry, ConfigEntry)
 
+    entry_data, values = hass.data[DOMAIN].get(HASS_DATA_CONFIG_SNAPSHOT, (None, {}))
+    if entry_data is not entry.data:
+        values = {}
+        hass.data[DOMAIN][HASS_DATA_CONFIG_SNAPSHOT] = (entry.data, values)
+    if key not in values:
+        values[key] = get_config_value(entry.data, key)
+    return values[key]
+
+
+def get_config_value(data: MappingProxyType[str, Any], key: str) -> Any:
+    """Parse configuration value from ConfigEntry.data."""
     if key in [CONF_INCLUDED_FOLDERS, CONF_IGNORED_ITEMS, CONF_IGNORED_FILES]:
-        return to_lists(entry.data, key)
+        return to_lists(data, key)
 
     if key in [CONF_IGNORED_STATES, CONF_CHECK_LOVELACE, CONF_STARTUP_DELAY]:
-        return get_val(entry.data, key)
+        return get_val(data, key)
 
     if key in [CONF_HEADER, CONF_REPORT_PATH, CONF_COLUMNS_WIDTH, CONF_FRIENDLY_NAMES]:
         section_name = CONF_SECTION_APPEARANCE_LOCATION
         if key == CONF_COLUMNS_WIDTH:
-            return to_listi(entry.data, CONF_COLUMNS_WIDTH, section_name)
+            return to_listi(data, CONF_COLUMNS_WIDTH, section_name)
         else:
-            return get_val(entry.data, key, section_name)
+            return get_val(data, key, section_name)
 
     assert False, "Unknown key {}".format(key)
 
 
-async def async_is_valid_path(path) -> bool:
-    """Validate the report path."""
+def is_valid_path(path) -> bool:
+    """Validate the report path.
+
+    This is a blocking function and should be run in the executor.
+    """
     folder, f_name = os.path.split(path)
     _LOGGER.debug(f"@@@[{folder}] [{f_name}] [{path}]")
-    if is_valid := (
-        folder.strip() and f_name.strip() and await anyio.Path(folder).exists()
-    ):
-        is_valid = not await anyio.Path(path).is_dir()
+    if is_valid := (folder.strip() and f_name.strip() and os.path.exists(folder)):
+        is_valid = not os.path.isdir(path)
     return is_valid
 
 
-async def async_get_next_file(folder_tuples, ignored_files):
-    """Return next file from scan queue."""
-    if not ignored_files:
-        ignored_files = ""
-    else:
-        ignored_files = "|".join([f"({fnmatch.translate(f)})" for f in ignored_files])
-    ignored_files_re = re.compile(ignored_files)
+def scan_folder(folder, name_re, ignored_files_re, files):
+    """Recursively collect files matching name_re using os.scandir.
+
+    Found files are appended to `files` as (path, ignored, stat_key) tuples, stat
+    of not ignored files is taken from DirEntry to save repeated stat() calls.
+    Like os.walk, unreadable folders are skipped and symlinks to folders
+    are not followed.
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subfolders = []
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subfolders.append(entry.path)
+        elif name_re.match(entry.name):
+            if ignored_files_re and ignored_files_re.match(entry.path):
+                files.append((entry.path, True, None))
+                continue
+            try:
+                stat = entry.stat()
+                stat_key = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stat_key = None
+            files.append((entry.path, False, stat_key))
+    for subfolder in subfolders:
+        scan_folder(subfolder, name_re, ignored_files_re, files)
+
+
+def get_config_files(folder_tuples, ignored_files_re=None):
+    """Scan each folder once and return files matching its glob pattern.
+
+    Pattern is expected in `[subfolder/]**/name_pattern` form. This is a blocking
+    function and should be run in the executor.
+    """
+    files = []
     for folder_name, glob_pattern in folder_tuples:
         _LOGGER.debug(
             f"{INDENT}Scan folder {folder_name} with pattern {glob_pattern} for configuration files"
         )
-        async for filename in anyio.Path(folder_name).glob(glob_pattern):
-            yield (
-                str(filename),
-                (ignored_files and ignored_files_re.match(str(filename))),
-            )
+        subfolder, _, name_pattern = glob_pattern.rpartition("**/")
+        name_re = re.compile(fnmatch.translate(name_pattern))
+        scan_folder(
+            os.path.join(folder_name, subfolder), name_re, ignored_files_re, files
+        )
+    return files
+
+
+async def async_get_next_file(hass, folder_tuples, ignored_files):
+    """Return next file from scan queue."""
+    ignored_files_re = None
+    if ignored_files:
+        ignored_files_re = re.compile(
+            "|".join([f"({fnmatch.translate(f)})" for f in ignored_files])
+        )
+    for file_tuple in await hass.async_add_executor_job(
+        get_config_files, folder_tuples, ignored_files_re
+    ):
+        yield file_tuple
 
 
 def is_action(hass, entry):
     """Check whether config entry is an action."""
     if not isinstance(entry, str):
         return False
-    domain, service = entry.split(".")[0], ".".join(entry.split(".")[1:])
+    domain, _, service = entry.partition(".")
     return hass.services.has_service(domain, service)
 
 
 def get_entity_state(hass, entry, friendly_names=False):
     """Return entity state or 'missing' if entity does not extst."""
     entity_state = hass.states.get(entry)
-    entity_registry = er.async_get(hass)
     name = None
-    if entity_state and entity_state.attributes.get("friendly_name", None):
-        if friendly_names:
-            name = entity_state.name
+    if (
+        friendly_names
+        and entity_state
+        and entity_state.attributes.get("friendly_name", None)
+    ):
+        name = entity_state.name
 
     if not entity_state:
         state = "missing"
-        if regentry := entity_registry.async_get(entry):
+        # registry is only needed to tell disabled entities from missing ones
+        if regentry := er.async_get(hass).async_get(entry):
             if regentry.disabled_by:
                 state = "disabled"
     else:
@@ -155,11 +228,24 @@ def get_entity_state(hass, entry, friendly_names=False):
     return state, name
 
 
-def renew_missing_actions_list(hass):
-    """Update list of missing actions when an action gets registered or removed."""
+def get_ignored_states(hass):
+    """Return ignored states in the form returned by get_entity_state.
+
+    Mapped set is reused until get_config returns a new list of ignored states.
+    """
+    ignored_states = get_config(hass, CONF_IGNORED_STATES, [])
+    cached = hass.data[DOMAIN].get(HASS_DATA_IGNORED_STATES)
+    if cached and cached[0] is ignored_states:
+        return cached[1]
+    mapped = frozenset(STATE_ALIASES.get(s, s) for s in ignored_states)
+    hass.data[DOMAIN][HASS_DATA_IGNORED_STATES] = (ignored_states, mapped)
+    return mapped
+
+
+def _missing_actions(hass, ignored_states):
     services_missing = {}
     _LOGGER.debug("::check_services:: Triaging list of found actions")
-    if "missing" in get_config(hass, CONF_IGNORED_STATES, []):
+    if "missing" in ignored_states:
         _LOGGER.debug(
             f"{INDENT}MISSING state set as ignored in config, so final list of reported actions is empty."
         )
@@ -170,37 +256,130 @@ def renew_missing_actions_list(hass):
     ):
         raise HomeAssistantError("Service list not found")
     parsed_service_list = hass.data[DOMAIN][HASS_DATA_PARSED_SERVICE_LIST]
+    has_service = hass.services.has_service
     for entry, occurrences in parsed_service_list.items():
-        if not is_action(hass, entry):
+        domain, _, service = entry.partition(".")
+        if not has_service(domain, service):
             services_missing[entry] = occurrences
             _LOGGER.debug(f"{INDENT}service {entry} added to the report")
     return services_missing
 
 
-def renew_missing_entities_list(hass):
-    """Update list of missing entities when a service from a config file changed its state."""
-    _LOGGER.debug("::check_entities:: Triaging list of found entities")
+def missing_entity_state(hass, entry, ignored_states):
+    """Return state of parsed entry if it should be reported, None otherwise."""
+    if is_action(hass, entry):  # this is a service, not entity
+        _LOGGER.debug(f"{INDENT}entry {entry} is service, skipping")
+        return None
+    state, _ = get_entity_state(hass, entry)
+    if state in ignored_states:
+        _LOGGER.debug(
+            f"{INDENT}entry {entry} with state {state} skipped due to ignored_states"
+        )
+        return None
+    return state if state in REPORTED_STATES else None
 
-    ignored_states = [
-        "unavail" if s == "unavailable" else s
-        for s in get_config(hass, CONF_IGNORED_STATES, [])
-    ]
+
+def _missing_entities(hass, ignored_states, entity_states=None, entries=None):
+    """Return missing entities, entries are (entity, occurrences) pairs to check.
+
+    All parsed entities are checked if entries are not given.
+    """
+    _LOGGER.debug("::check_entities:: Triaging list of found entities")
     if DOMAIN not in hass.data or HASS_DATA_PARSED_ENTITY_LIST not in hass.data[DOMAIN]:
         _LOGGER.error(f"{INDENT}Entity list not found")
         raise Exception("Entity list not found")
-    parsed_entity_list = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+    if entries is None:
+        entries = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST].items()
     entities_missing = {}
-    for entry, occurrences in parsed_entity_list.items():
-        if is_action(hass, entry):  # this is a service, not entity
-            _LOGGER.debug(f"{INDENT}entry {entry} is service, skipping")
+    states_get = hass.states.get
+    for entry, occurrences in entries:
+        entity_state = states_get(entry)
+        if entity_state is not None and entity_state.state not in CANDIDATE_STATES:
+            # healthy entity is never reported, no need for further checks
             continue
-        state, _ = get_entity_state(hass, entry)
-        if state in ignored_states:
-            _LOGGER.debug(
-                f"{INDENT}entry {entry} with state {state} skipped due to ignored_states"
-            )
-            continue
-        if state in ["missing", "unknown", "unavail", "disabled"]:
+        if state := missing_entity_state(hass, entry, ignored_states):
             entities_missing[entry] = occurrences
+            if entity_states is not None:
+                entity_states[entry] = state
             _LOGGER.debug(f"{INDENT}entry {entry} added to the report")
     return entities_missing
+
+
+def update_missing_entities(hass, entities_missing, entity_ids, entity_states=None):
+    """Return new dict of missing entities with status of entity_ids renewed.
+
+    Only given entities are checked, the rest is taken from entities_missing.
+    States of reported entities are updated in entity_states if it is given.
+    entities_missing itself is returned if neither the set of missing entities
+    nor any of their states has changed.
+    """
+    ignored_states = get_ignored_states(hass)
+    parsed_entity_list = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+    # collect results first and apply them to the dict in bulk afterwards
+    found = {}
+    cleared = set()
+    for entry in entity_ids:
+        if entry not in parsed_entity_list:
+            continue
+        state = missing_entity_state(hass, entry, ignored_states)
+        if state:
+            found[entry] = state
+        elif entry in entities_missing:
+            cleared.add(entry)
+    added = found.keys() - entities_missing.keys()
+    changed = bool(added or cleared)
+    if entity_states is not None:
+        changed = changed or any(
+            entity_states.get(entry) != state for entry, state in found.items()
+        )
+        entity_states.update(found)
+        for entry in cleared:
+            entity_states.pop(entry, None)
+    if not changed:
+        return entities_missing
+    if added:
+        # keep entities in the order they were found by parser
+        keep = (entities_missing.keys() - cleared) | added
+        return {e: occ for e, occ in parsed_entity_list.items() if e in keep}
+    return {e: occ for e, occ in entities_missing.items() if e not in cleared}
+
+
+async def async_check_missing(hass, chunk_size, entity_states=None):
+    """Return missing actions and entities, configuration is read once for both.
+
+    States of missing entities are stored to entity_states if it is given.
+    Parsed entities are checked in chunks of chunk_size, the event loop
+    gets control between chunks.
+    """
+    ignored_states = get_ignored_states(hass)
+    services_missing = _missing_actions(hass, ignored_states)
+    entries = list(hass.data[DOMAIN].get(HASS_DATA_PARSED_ENTITY_LIST, {}).items())
+    entities_missing = _missing_entities(
+        hass, ignored_states, entity_states, entries[:chunk_size]
+    )
+    for i in range(chunk_size, len(entries), chunk_size):
+        await asyncio.sleep(0)
+        entities_missing.update(
+            _missing_entities(
+                hass, ignored_states, entity_states, entries[i : i + chunk_size]
+            )
+        )
+    return services_missing, entities_missing
+
+
+def get_friendly_name(hass, entry):
+    """Return entity friendly name or None if it is not set."""
+    entity_state = hass.states.get(entry)
+    if entity_state and entity_state.attributes.get("friendly_name", None):
+        return entity_state.name
+    return None
+
+
+def renew_missing_actions_list(hass):
+    """Update list of missing actions when an action gets registered or removed."""
+    return _missing_actions(hass, get_ignored_states(hass))
+
+
+def renew_missing_entities_list(hass):
+    """Update list of missing entities when a service from a config file changed its state."""
+    return _missing_entities(hass, get_ignored_states(hass))
@@ -1,10 +1,16 @@
 """Test proper handling of entity state changes."""
 
+from unittest.mock import patch
+
 from homeassistant.core import callback
+from custom_components.watchman import coordinator as wm_coordinator
 from custom_components.watchman.const import (
     DOMAIN,
+    HASS_DATA_COORDINATOR,
     HASS_DATA_MISSING_ENTITIES,
     HASS_DATA_MISSING_SERVICES,
+    SENSOR_LAST_UPDATE,
+    SENSOR_MISSING_ENTITIES,
 )
 from . import async_init_integration
 
@@ -71,3 +77,149 @@ async def test_add_entity(hass):
     hass.states.async_set("sensor.test4_avail", "42")
     await hass.async_block_till_done()
     assert len(hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]) == 3
+
+
+async def test_change_state_during_refresh(hass):
+    """Test state change made while changed entities are being rechecked."""
+    hass.states.async_set("sensor.test1_unknown", "unknown")
+    hass.states.async_set("sensor.test2_missing", "missing")
+    hass.states.async_set("sensor.test3_unavail", "unavailable")
+    hass.states.async_set("sensor.test4_avail", "42")
+    await async_init_integration(hass)
+    assert len(hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]) == 3
+
+    update_missing_entities = wm_coordinator.update_missing_entities
+    changed = False
+
+    def update_and_change_state(*args):
+        """Change state of another entity while refresh holds the lock."""
+        nonlocal changed
+        if not changed:
+            changed = True
+            hass.states.async_set("sensor.test4_avail", "unavailable")
+        return update_missing_entities(*args)
+
+    with (
+        patch.object(wm_coordinator, "DIRTY_ENTITIES_CHUNK_SIZE", 1),
+        patch.object(
+            wm_coordinator,
+            "update_missing_entities",
+            side_effect=update_and_change_state,
+        ),
+    ):
+        hass.states.async_set("sensor.test1_unknown", "on")
+        hass.states.async_set("sensor.test3_unavail", "on")
+        await hass.async_block_till_done()
+    assert changed
+    assert set(hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]) == {
+        "sensor.test2_missing",
+        "sensor.test4_avail",
+    }
+
+
+async def test_add_service_during_refresh(hass):
+    """Test service registered while a full check is running."""
+
+    @callback
+    def dummy_service_handler(event):  # pylint: disable=unused-argument
+        """Test service handler."""
+
+    await async_init_integration(hass)
+    assert len(hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES]) == 3
+
+    async_check_missing = wm_coordinator.async_check_missing
+    registered = False
+
+    async def check_and_register(*args):
+        """Register another service while refresh holds the lock."""
+        nonlocal registered
+        if not registered:
+            registered = True
+            hass.services.async_register("fake", "service2", dummy_service_handler)
+            await hass.async_block_till_done()
+        return await async_check_missing(*args)
+
+    with patch.object(
+        wm_coordinator, "async_check_missing", side_effect=check_and_register
+    ):
+        hass.services.async_register("fake", "service1", dummy_service_handler)
+        await hass.async_block_till_done()
+    assert registered
+    assert len(hass.data[DOMAIN][HASS_DATA_MISSING_SERVICES]) == 1
+
+
+async def test_state_changes_coalesced(hass):
+    """Test burst of state changes is served by a single refresh."""
+    hass.states.async_set("sensor.test1_unknown", "unknown")
+    hass.states.async_set("sensor.test2_missing", "missing")
+    hass.states.async_set("sensor.test3_unavail", "unavailable")
+    hass.states.async_set("sensor.test4_avail", "42")
+    await async_init_integration(hass)
+    coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+    with patch.object(
+        coordinator, "_async_update_data", wraps=coordinator._async_update_data
+    ) as update_data:
+        hass.states.async_set("sensor.test1_unknown", "on")
+        hass.states.async_set("sensor.test2_missing", "on")
+        hass.states.async_set("sensor.test3_unavail", "on")
+        await hass.async_block_till_done()
+    assert update_data.call_count == 1
+    assert len(hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]) == 0
+    assert coordinator.data.missing_entities == 0
+
+
+async def test_change_between_missing_states(hass):
+    """Test entity which stays missing with another state."""
+    hass.states.async_set("sensor.test1_unknown", "unknown")
+    hass.states.async_set("sensor.test2_missing", "missing")
+    hass.states.async_set("sensor.test3_unavail", "unavailable")
+    hass.states.async_set("sensor.test4_avail", "42")
+    await async_init_integration(hass)
+    coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+    states = {attr["id"]: attr["state"] for attr in coordinator.data.entity_attrs}
+    assert states["sensor.test1_unknown"] == "unknown"
+    hass.states.async_set("sensor.test1_unknown", "unavailable")
+    await hass.async_block_till_done()
+    assert len(hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]) == 3
+    states = {attr["id"]: attr["state"] for attr in coordinator.data.entity_attrs}
+    assert states["sensor.test1_unknown"] == "unavail"
+
+
+async def test_entity_recovery(hass):
+    """Test entity which becomes available is removed from sensor attributes."""
+    hass.states.async_set("sensor.test1_unknown", "unknown")
+    hass.states.async_set("sensor.test2_missing", "missing")
+    hass.states.async_set("sensor.test3_unavail", "unavailable")
+    hass.states.async_set("sensor.test4_avail", "42")
+    await async_init_integration(hass)
+    coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+    hass.states.async_set("sensor.test3_unavail", "on")
+    await hass.async_block_till_done()
+    assert "sensor.test3_unavail" not in hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]
+    assert coordinator.data.missing_entities == 2
+    assert [attr["id"] for attr in coordinator.data.entity_attrs] == [
+        "sensor.test1_unknown",
+        "sensor.test2_missing",
+    ]
+
+
+async def test_timestamp_only_refresh(hass, freezer):
+    """Test refresh which renews only the timestamp keeps missing sensors intact."""
+    hass.states.async_set("sensor.test1_unknown", "unknown")
+    hass.states.async_set("sensor.test2_missing", "missing")
+    hass.states.async_set("sensor.test3_unavail", "unavailable")
+    hass.states.async_set("sensor.test4_avail", "42")
+    await async_init_integration(hass)
+    coordinator = hass.data[DOMAIN][HASS_DATA_COORDINATOR]
+    missing_before = hass.states.get(f"sensor.{SENSOR_MISSING_ENTITIES}")
+    updated_before = hass.states.get(f"sensor.{SENSOR_LAST_UPDATE}")
+
+    freezer.tick(60)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    missing_after = hass.states.get(f"sensor.{SENSOR_MISSING_ENTITIES}")
+    assert missing_after.state == "3"
+    assert missing_after.last_reported == missing_before.last_reported
+    updated_after = hass.states.get(f"sensor.{SENSOR_LAST_UPDATE}")
+    assert updated_after.state != updated_before.state
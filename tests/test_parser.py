@@ -0,0 +1,65 @@
+"""Test parse results cache."""
+
+import os
+from unittest.mock import patch
+
+from custom_components.watchman.const import (
+    CONF_CHECK_LOVELACE,
+    CONF_INCLUDED_FOLDERS,
+    DOMAIN,
+    HASS_DATA_MISSING_ENTITIES,
+    HASS_DATA_PARSE_CACHE,
+    HASS_DATA_PARSED_ENTITY_LIST,
+)
+from custom_components.watchman.utils import parser
+from custom_components.watchman.utils.parser import parse_config
+
+from . import async_init_integration
+
+TEST_LOVELACE_CONFIG_DIR = "/workspaces/thewatchman/tests/input_lovelace"
+
+
+async def test_parse_cache(hass, tmp_path):
+    """Test unchanged files are taken from cache and edited files are parsed."""
+    yaml_file = tmp_path / "config.yaml"
+    yaml_file.write_text("sensor.cached_one\n", encoding="utf-8")
+    await async_init_integration(
+        hass, add_params={CONF_INCLUDED_FOLDERS: str(tmp_path)}
+    )
+    cache = hass.data[DOMAIN][HASS_DATA_PARSE_CACHE]
+    cache_key = next(key for key in cache if key.endswith("config.yaml"))
+    cached = cache[cache_key]
+    assert "sensor.cached_one" in hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+
+    # unchanged file is taken from cache without scheduling an executor job
+    with patch.object(parser, "parse_file", wraps=parser.parse_file) as parse_file:
+        await parse_config(hass, reason="test")
+    parse_file.assert_not_called()
+    assert cache[cache_key] is cached
+    assert "sensor.cached_one" in hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+
+    # touch the file, content hash matches so the file is not scanned again
+    stat = os.stat(yaml_file)
+    os.utime(yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    await parse_config(hass, reason="test")
+    touched = cache[cache_key]
+    assert touched[0] != cached[0]
+    assert touched[1] == cached[1]
+    assert touched[2] is cached[2]
+    assert "sensor.cached_one" in hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+
+    # edit the file, it is parsed again
+    yaml_file.write_text("sensor.cached_two\n", encoding="utf-8")
+    await parse_config(hass, reason="test")
+    edited = cache[cache_key]
+    assert edited[1] != cached[1]
+    parsed_entity_list = hass.data[DOMAIN][HASS_DATA_PARSED_ENTITY_LIST]
+    assert "sensor.cached_two" in parsed_entity_list
+    assert "sensor.cached_one" not in parsed_entity_list
+
+
+async def test_lovelace_dashboard(hass):
+    """Test entities from lovelace dashboards in .storage folder are reported."""
+    hass.config.config_dir = TEST_LOVELACE_CONFIG_DIR
+    await async_init_integration(hass, add_params={CONF_CHECK_LOVELACE: True})
+    assert "sensor.lovelace_missing" in hass.data[DOMAIN][HASS_DATA_MISSING_ENTITIES]